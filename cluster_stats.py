@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cluster statistics module for the SEO Analysis Tool.
+Contains a shared numeric kernel for summarizing cluster metrics.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _aggregate(impressions, clicks, positions):
+        """Native-compiled reduction over the three metric arrays."""
+        total_impressions = 0.0
+        total_clicks = 0.0
+        weighted_position = 0.0
+
+        for i in range(impressions.shape[0]):
+            total_impressions += impressions[i]
+            total_clicks += clicks[i]
+            weighted_position += clicks[i] * positions[i]
+
+        avg_position = weighted_position / total_clicks if total_clicks > 0 else 0.0
+
+        return total_impressions, total_clicks, avg_position
+else:
+    def _aggregate(impressions, clicks, positions):
+        """Vectorized numpy fallback when numba is not installed."""
+        total_clicks = float(clicks.sum())
+        avg_position = float((clicks * positions).sum() / total_clicks) if total_clicks > 0 else 0.0
+
+        return float(impressions.sum()), total_clicks, avg_position
+
+
+def aggregate_clusters(impressions, clicks, positions):
+    """
+    Aggregate per-cluster metrics into overall totals.
+
+    Args:
+        impressions (array-like): Impression (or volume) count per cluster
+        clicks (array-like): Click (or traffic) count per cluster
+        positions (array-like): Average position per cluster
+
+    Returns:
+        tuple: (total impressions, total clicks, click-weighted mean position)
+    """
+    impressions = np.ascontiguousarray(impressions, dtype=np.float64)
+    clicks = np.ascontiguousarray(clicks, dtype=np.float64)
+    positions = np.ascontiguousarray(positions, dtype=np.float64)
+
+    return _aggregate(impressions, clicks, positions)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Driver that runs the report-generation tests in parallel processes.
+
+Each test spends most of its time in python-docx XML serialization, which
+is CPU-bound and holds the GIL, so separate processes are the only way to
+overlap them. The same effect is available through pytest-xdist with
+`pytest -n auto test_*_report.py`.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Module/function pairs for the independent report tests
+REPORT_TESTS = [
+    ("test_seo_report", "test_seo_report_generation"),
+    ("test_final_report", "test_final_report_generation"),
+    ("test_search_console_report", "test_search_console_report_generation"),
+    ("test_semrush_report", "test_semrush_report_generation"),
+    ("test_comparison_report", "test_comparison_report_generation"),
+    ("test_combined_report", "test_combined_report_generation"),
+]
+
+
+def _run_test(module_name, function_name):
+    """Import the test module in this process and run one test function."""
+    module = __import__(module_name)
+    getattr(module, function_name)()
+    return f"{module_name}.{function_name}"
+
+
+def main():
+    """Run every report test in its own process and report the outcome."""
+    failures = []
+
+    with ProcessPoolExecutor(max_workers=len(REPORT_TESTS)) as executor:
+        futures = {
+            executor.submit(_run_test, module_name, function_name): (module_name, function_name)
+            for module_name, function_name in REPORT_TESTS
+        }
+
+        for future, (module_name, function_name) in futures.items():
+            try:
+                print(f"Completed: {future.result()}")
+            except Exception as e:
+                failures.append((module_name, function_name, e))
+                print(f"Failed: {module_name}.{function_name}: {e}")
+
+    if failures:
+        print(f"{len(failures)} report test(s) failed")
+        return 1
+
+    print("All report tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
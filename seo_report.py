@@ -14,13 +14,34 @@ from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.section import WD_SECTION
 import os
 from datetime import datetime
 import io
+from cluster_stats import aggregate_clusters
 from wordcloud import WordCloud
 import matplotlib.cm as cm
 import matplotlib.colors as mcolors
 
+# python-docx re-reads and unzips its default template on every
+# Document() call; cache the raw bytes once and build documents from the
+# in-memory copy instead
+_TEMPLATE_BYTES = None
+
+
+def _new_document():
+    """Create an empty Document from the cached default template."""
+    global _TEMPLATE_BYTES
+
+    if _TEMPLATE_BYTES is None:
+        import docx
+        template_path = os.path.join(os.path.dirname(docx.__file__), "templates", "default.docx")
+        with open(template_path, "rb") as f:
+            _TEMPLATE_BYTES = f.read()
+
+    return Document(io.BytesIO(_TEMPLATE_BYTES))
+
+
 class ReportGenerator:
     """Class for generating reports."""
     
@@ -57,7 +78,7 @@ class ReportGenerator:
         print(f"Starting SEO report generation for URL: {url}...")
         
         # Create a new document
-        doc = Document()
+        doc = _new_document()
         print("Report document created (10% complete)")
         
         # Add styles
@@ -142,7 +163,7 @@ class ReportGenerator:
         print("Starting Search Console report generation...")
         
         # Create a new document
-        doc = Document()
+        doc = _new_document()
         print("Report document created (10% complete)")
         
         # Add styles
@@ -202,7 +223,7 @@ class ReportGenerator:
         print("Starting SEMrush report generation...")
         
         # Create a new document
-        doc = Document()
+        doc = _new_document()
         print("Report document created (10% complete)")
         
         # Add styles
@@ -269,7 +290,7 @@ class ReportGenerator:
         print("Starting comparison report generation...")
         
         # Create a new document
-        doc = Document()
+        doc = _new_document()
         print("Report document created (10% complete)")
         
         # Add styles
@@ -354,7 +375,7 @@ class ReportGenerator:
         print(f"Starting final report generation for URL: {url}...")
         
         # Create a new document
-        doc = Document()
+        doc = _new_document()
         print("Report document created (5% complete)")
         
         # Add styles
@@ -450,9 +471,97 @@ class ReportGenerator:
         self.logger.info(f"Final report saved to: {filepath}")
         print(f"Final report completed (100%)")
         print(f"Report saved to: {filepath}")
-        
+
         return filepath
-    
+
+    def generate_combined_report(self, url, meta_analyzer, image_analyzer, links_analyzer, reachability_analyzer, topic_analyzer, search_console_analyzer=None, semrush_analyzer=None, search_console_comparison=None):
+        """
+        Generate every report as sections of a single document.
+
+        Writing one file amortizes the template parse, the XML
+        serialization and the ZIP compression pass that each separate
+        report would otherwise pay on its own save.
+
+        Args:
+            url (str): The URL
+            meta_analyzer (MetaDescriptionAnalyzer): The meta description analyzer
+            image_analyzer (ImageAnalyzer): The image analyzer
+            links_analyzer (LinksAnalyzer): The links analyzer
+            reachability_analyzer (ReachabilityAnalyzer): The reachability analyzer
+            topic_analyzer (MainTopicAnalyzer): The main topic analyzer
+            search_console_analyzer (SearchConsoleAnalyzer, optional): The Search Console analyzer
+            semrush_analyzer (SEMrushAnalyzer, optional): The SEMrush analyzer
+            search_console_comparison (SearchConsoleComparison, optional): The Search Console comparison
+
+        Returns:
+            str: The path to the generated report
+        """
+        self.logger.info(f"Generating combined report for URL: {url}")
+        print(f"Starting combined report generation for URL: {url}...")
+
+        # Create a new document
+        doc = _new_document()
+
+        # Add styles
+        self._add_styles(doc)
+
+        # SEO analysis section
+        self._add_title(doc, f"SEO Analysis Report: {url}")
+        self._add_date(doc)
+        self._add_summary(doc, url, meta_analyzer, image_analyzer, links_analyzer, reachability_analyzer, topic_analyzer)
+        self._add_meta_description_analysis(doc, meta_analyzer)
+        self._add_image_analysis(doc, image_analyzer)
+        self._add_links_analysis(doc, links_analyzer)
+        self._add_reachability_analysis(doc, reachability_analyzer)
+        self._add_topic_analysis(doc, topic_analyzer)
+        self._add_recommendations(doc, meta_analyzer, image_analyzer, links_analyzer, reachability_analyzer, topic_analyzer, search_console_analyzer, semrush_analyzer)
+        print("SEO analysis section added")
+
+        # Search Console section on a new page
+        if search_console_analyzer:
+            doc.add_section(WD_SECTION.NEW_PAGE)
+            self._add_title(doc, "Search Console Analysis Report")
+            self._add_clusters_analysis(doc, search_console_analyzer.get_clusters(), "Query")
+            self._add_topics_analysis(doc, search_console_analyzer.get_topics())
+            self._add_internal_link_suggestions(doc, search_console_analyzer.suggest_internal_links(), "Search Console")
+            print("Search Console section added")
+
+        # SEMrush section on a new page
+        if semrush_analyzer:
+            doc.add_section(WD_SECTION.NEW_PAGE)
+            self._add_title(doc, "SEMrush Analysis Report")
+            self._add_clusters_analysis(doc, semrush_analyzer.get_clusters(), "Keyword")
+            self._add_topics_analysis(doc, semrush_analyzer.get_topics())
+            self._add_visibility_traffic_analysis(doc, semrush_analyzer.get_visibility(), semrush_analyzer.get_traffic())
+            self._add_internal_link_suggestions(doc, semrush_analyzer.suggest_internal_links(), "SEMrush")
+            print("SEMrush section added")
+
+        # Comparison section on a new page
+        if search_console_comparison:
+            doc.add_section(WD_SECTION.NEW_PAGE)
+            self._add_title(doc, "Search Console Comparison Report")
+            self._add_query_comparison(doc, search_console_comparison.get_query_comparison())
+            self._add_landing_page_comparison(doc, search_console_comparison.get_landing_page_comparison())
+            self._add_improved_queries(doc, search_console_comparison.get_improved_queries())
+            self._add_declined_queries(doc, search_console_comparison.get_declined_queries())
+            self._add_improved_landing_pages(doc, search_console_comparison.get_improved_landing_pages())
+            self._add_declined_landing_pages(doc, search_console_comparison.get_declined_landing_pages())
+            print("Comparison section added")
+
+        # Save the document once for every section
+        print("Saving report document...")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"combined_report_{timestamp}.docx"
+        filepath = os.path.join(self.output_dir, filename)
+
+        doc.save(filepath)
+
+        self.logger.info(f"Combined report saved to: {filepath}")
+        print(f"Combined report completed (100%)")
+        print(f"Report saved to: {filepath}")
+
+        return filepath
+
     def _add_styles(self, doc):
         """
         Add styles to the document.
@@ -852,6 +961,30 @@ class ReportGenerator:
                 row_cells[2].text = f"Queries: {cluster['queries']}\nImpressions: {cluster['impressions']:.0f}\nClicks: {cluster['clicks']:.0f}\nAvg Position: {cluster['avg_position']:.1f}"
             else:
                 row_cells[2].text = f"Keywords: {cluster['keywords']}\nTraffic: {cluster['traffic']:.0f}\nAvg Position: {cluster['avg_position']:.1f}\nSearch Volume: {cluster['search_volume']:.0f}"
+
+        # Close the table with overall totals, reduced by the shared
+        # cluster_stats kernel
+        if clusters:
+            if item_type == "Query":
+                counts = [cluster["impressions"] for cluster in clusters]
+                weights = [cluster["clicks"] for cluster in clusters]
+            else:
+                counts = [cluster["search_volume"] for cluster in clusters]
+                weights = [cluster["traffic"] for cluster in clusters]
+
+            positions = [cluster["avg_position"] for cluster in clusters]
+            total_counts, total_weights, avg_position = aggregate_clusters(counts, weights, positions)
+
+            if item_type == "Query":
+                doc.add_paragraph(
+                    f"Overall: {total_counts:.0f} impressions, {total_weights:.0f} clicks, "
+                    f"click-weighted avg position {avg_position:.1f}"
+                )
+            else:
+                doc.add_paragraph(
+                    f"Overall: {total_counts:.0f} search volume, {total_weights:.0f} traffic, "
+                    f"traffic-weighted avg position {avg_position:.1f}"
+                )
     
     def _add_topics_analysis(self, doc, topics):
         """
@@ -9,13 +9,48 @@ Contains classes for loading and analyzing Search Console data.
 import logging
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.cluster import MiniBatchKMeans
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations, islice
 import re
 import os
 from datetime import datetime
 
+# Polars is optional; when available it provides a multi-threaded CSV
+# parser and parallel groupby engine for large Search Console exports
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Numba is optional; when available the per-cluster metric reduction
+# runs as a single compiled pass instead of a pandas groupby
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _cluster_reduce(labels, impressions, clicks, positions, n_clusters):
+        """Accumulate per-cluster counts and metric sums in one scan."""
+        counts = np.zeros(n_clusters, dtype=np.int64)
+        impression_sums = np.zeros(n_clusters, dtype=np.int64)
+        click_sums = np.zeros(n_clusters, dtype=np.int64)
+        position_sums = np.zeros(n_clusters, dtype=np.float64)
+
+        for i in range(labels.shape[0]):
+            label = labels[i]
+            counts[label] += 1
+            impression_sums[label] += impressions[i]
+            click_sums[label] += clicks[i]
+            position_sums[label] += positions[i]
+
+        return counts, impression_sums, click_sums, position_sums
+
 class SearchConsoleData:
     """Class for loading and processing Search Console data."""
     
@@ -30,9 +65,15 @@ class SearchConsoleData:
         self.data = None
         self.queries = []
         self.landing_pages = []
-        
+
+        self._pl_data = None
+        self._query_agg = None
+        self._landing_agg = None
+        self._query_index = None
+        self._page_index = None
+
         self.logger = logging.getLogger(__name__)
-    
+
     def load(self):
         """
         Load the Search Console data.
@@ -42,21 +83,37 @@ class SearchConsoleData:
         """
         self.logger.info(f"Loading Search Console data from: {self.file_path}")
         
+        required_columns = ["Query", "Landing Page", "Impressions", "Url Clicks", "Average Position"]
+
         try:
-            # Load the CSV file
-            self.data = pd.read_csv(self.file_path)
-            
-            # Check if the required columns are present
-            required_columns = ["Query", "Landing Page", "Impressions", "Url Clicks", "Average Position"]
-            
+            # Probe the header first so malformed files fail before a full parse
+            header = pd.read_csv(self.file_path, nrows=1)
+
             for column in required_columns:
-                if column not in self.data.columns:
+                if column not in header.columns:
                     self.logger.error(f"Required column not found: {column}")
                     return {
                         "success": False,
                         "message": f"Required column not found: {column}",
                     }
-            
+
+            # Only parse the columns that are used (keep Topic when present)
+            use_columns = list(required_columns)
+            if "Topic" in header.columns:
+                use_columns.append("Topic")
+
+            # Load the CSV file (Polars streaming parser when available)
+            if pl is not None:
+                try:
+                    self.data = self._load_polars(use_columns)
+                except Exception:
+                    # Older polars releases expose a different collect API;
+                    # the pandas path produces the same frame
+                    self._pl_data = None
+                    self.data = self._load_pandas(use_columns)
+            else:
+                self.data = self._load_pandas(use_columns)
+
             # Clean the data
             self.clean_data()
             
@@ -83,49 +140,136 @@ class SearchConsoleData:
                 "message": f"Error loading Search Console data: {str(e)}",
             }
     
+    def _load_polars(self, columns):
+        """
+        Load and clean the CSV file with Polars.
+
+        Uses lazy scanning so parsing, column projection, numeric coercion
+        and null-dropping run in a single streaming, multi-threaded pass.
+
+        Args:
+            columns (list): The columns to parse
+
+        Returns:
+            pandas.DataFrame: The loaded data
+        """
+        # Coerce numeric columns (invalid values become null) and drop incomplete rows
+        lazy_frame = pl.scan_csv(self.file_path).select(columns).with_columns([
+            pl.col("Impressions").cast(pl.Int64, strict=False),
+            pl.col("Url Clicks").cast(pl.Int64, strict=False),
+            pl.col("Average Position").cast(pl.Float64, strict=False),
+        ]).drop_nulls(["Query", "Landing Page", "Impressions", "Url Clicks", "Average Position"])
+
+        self._pl_data = lazy_frame.collect(engine="streaming")
+
+        return self._pl_data.to_pandas()
+
+    def _load_pandas(self, columns):
+        """
+        Load the CSV file with pandas.
+
+        Prefers the multi-threaded pyarrow parser with an explicit dtype
+        schema, so type inference and object-dtype strings are avoided.
+        Falls back to the C engine, reading very large files in chunks.
+
+        Args:
+            columns (list): The columns to parse
+
+        Returns:
+            pandas.DataFrame: The loaded data
+        """
+        dtypes = {
+            "Query": "string",
+            "Landing Page": "string",
+            "Impressions": "int64",
+            "Url Clicks": "int64",
+            "Average Position": "float64",
+        }
+
+        try:
+            return pd.read_csv(self.file_path, engine="pyarrow", dtype=dtypes, usecols=columns)
+        except (ImportError, ValueError, TypeError):
+            # pyarrow missing or the schema doesn't fit; let clean_data coerce
+            pass
+
+        # Read very large files in chunks to keep peak memory bounded
+        if os.path.getsize(self.file_path) > 100 * 1024 * 1024:
+            chunks = pd.read_csv(self.file_path, engine="c", low_memory=False, usecols=columns, chunksize=500_000)
+            return pd.concat(chunks, ignore_index=True)
+
+        return pd.read_csv(self.file_path, engine="c", low_memory=False, usecols=columns)
+
     def clean_data(self):
         """Clean the Search Console data."""
-        # Remove rows with missing values
-        self.data = self.data.dropna(subset=["Query", "Landing Page", "Impressions", "Url Clicks", "Average Position"])
-        
-        # Convert numeric columns to numeric types
-        self.data["Impressions"] = pd.to_numeric(self.data["Impressions"], errors="coerce")
-        self.data["Url Clicks"] = pd.to_numeric(self.data["Url Clicks"], errors="coerce")
-        self.data["Average Position"] = pd.to_numeric(self.data["Average Position"], errors="coerce")
-        
-        # Remove rows with invalid numeric values
-        self.data = self.data.dropna(subset=["Impressions", "Url Clicks", "Average Position"])
-        
+        # The row positions change, so drop any cached lookup indexes
+        self._query_index = None
+        self._page_index = None
+
+        # The Polars loader already drops nulls and coerces numerics while parsing
+        if self._pl_data is None:
+            # Convert numeric columns to numeric types
+            self.data["Impressions"] = pd.to_numeric(self.data["Impressions"], errors="coerce")
+            self.data["Url Clicks"] = pd.to_numeric(self.data["Url Clicks"], errors="coerce")
+            self.data["Average Position"] = pd.to_numeric(self.data["Average Position"], errors="coerce")
+
+            # Remove rows with missing or invalid values in a single slice
+            valid = self.data[["Query", "Landing Page", "Impressions", "Url Clicks", "Average Position"]].notna().all(axis=1).to_numpy()
+            self.data = self.data.loc[valid].reset_index(drop=True)
+
+        # Shrink the frame: counts to the smallest unsigned int, positions
+        # to float32, and the repeated string columns to category codes
+        self.data["Impressions"] = pd.to_numeric(self.data["Impressions"], downcast="unsigned")
+        self.data["Url Clicks"] = pd.to_numeric(self.data["Url Clicks"], downcast="unsigned")
+        self.data["Average Position"] = self.data["Average Position"].astype(np.float32)
+        self.data["Query"] = self.data["Query"].astype("category")
+        self.data["Landing Page"] = self.data["Landing Page"].astype("category")
+
         # Add a Topic column if it doesn't exist
         if "Topic" not in self.data.columns:
             self.data["Topic"] = ""
-    
+
     def extract_queries_and_landing_pages(self):
         """Extract queries and landing pages from the data."""
-        # Group by query and aggregate metrics
-        query_data = self.data.groupby("Query").agg({
-            "Impressions": "sum",
-            "Url Clicks": "sum",
-            "Average Position": "mean",
-        }).reset_index()
-        
-        # Sort by impressions in descending order
-        query_data = query_data.sort_values("Impressions", ascending=False)
-        
+        if self._pl_data is not None:
+            # Aggregate with Polars' parallel hash-group engine
+            query_data = self._pl_data.group_by("Query").agg([
+                pl.col("Impressions").sum(),
+                pl.col("Url Clicks").sum(),
+                pl.col("Average Position").mean(),
+            ]).sort("Impressions", descending=True).to_pandas()
+
+            landing_page_data = self._pl_data.group_by("Landing Page").agg([
+                pl.col("Impressions").sum(),
+                pl.col("Url Clicks").sum(),
+                pl.col("Average Position").mean(),
+            ]).sort("Impressions", descending=True).to_pandas()
+        else:
+            # Group by query and aggregate metrics
+            query_data = self.data.groupby("Query").agg({
+                "Impressions": "sum",
+                "Url Clicks": "sum",
+                "Average Position": "mean",
+            }).reset_index()
+
+            # Sort by impressions in descending order
+            query_data = query_data.sort_values("Impressions", ascending=False)
+
+            # Group by landing page and aggregate metrics
+            landing_page_data = self.data.groupby("Landing Page").agg({
+                "Impressions": "sum",
+                "Url Clicks": "sum",
+                "Average Position": "mean",
+            }).reset_index()
+
+            # Sort by impressions in descending order
+            landing_page_data = landing_page_data.sort_values("Impressions", ascending=False)
+
+        # Keep the aggregated frames so consumers can reuse them
+        self._query_agg = query_data
+        self._landing_agg = landing_page_data
+
         # Convert to list of dictionaries
         self.queries = query_data.to_dict("records")
-        
-        # Group by landing page and aggregate metrics
-        landing_page_data = self.data.groupby("Landing Page").agg({
-            "Impressions": "sum",
-            "Url Clicks": "sum",
-            "Average Position": "mean",
-        }).reset_index()
-        
-        # Sort by impressions in descending order
-        landing_page_data = landing_page_data.sort_values("Impressions", ascending=False)
-        
-        # Convert to list of dictionaries
         self.landing_pages = landing_page_data.to_dict("records")
     
     def get_data(self):
@@ -155,6 +299,28 @@ class SearchConsoleData:
         """
         return self.landing_pages
     
+    def get_query_agg(self):
+        """
+        Get the aggregated metrics per query.
+
+        Returns:
+            pandas.DataFrame: The aggregated query metrics
+        """
+        if self._query_agg is None:
+            self.extract_queries_and_landing_pages()
+        return self._query_agg
+
+    def get_landing_agg(self):
+        """
+        Get the aggregated metrics per landing page.
+
+        Returns:
+            pandas.DataFrame: The aggregated landing page metrics
+        """
+        if self._landing_agg is None:
+            self.extract_queries_and_landing_pages()
+        return self._landing_agg
+
     def get_query_data(self, query):
         """
         Get data for a specific query.
@@ -165,7 +331,14 @@ class SearchConsoleData:
         Returns:
             pandas.DataFrame: The data for the query
         """
-        return self.data[self.data["Query"] == query]
+        # Build the row-position index once; later calls are O(1) lookups
+        if self._query_index is None:
+            self._query_index = self.data.groupby("Query", sort=False, observed=True).indices
+
+        if query not in self._query_index:
+            return self.data.iloc[0:0]
+
+        return self.data.take(self._query_index[query])
     
     def get_landing_page_data(self, landing_page):
         """
@@ -177,7 +350,13 @@ class SearchConsoleData:
         Returns:
             pandas.DataFrame: The data for the landing page
         """
-        return self.data[self.data["Landing Page"] == landing_page]
+        if self._page_index is None:
+            self._page_index = self.data.groupby("Landing Page", sort=False, observed=True).indices
+
+        if landing_page not in self._page_index:
+            return self.data.iloc[0:0]
+
+        return self.data.take(self._page_index[landing_page])
     
     def to_dataframe(self):
         """
@@ -204,9 +383,11 @@ class SearchConsoleAnalyzer:
         
         self.clusters = []
         self.topics = {}
-        
+
+        self._page_cluster_agg = None
+
         self.logger = logging.getLogger(__name__)
-    
+
     def analyze(self):
         """
         Analyze the Search Console data.
@@ -235,79 +416,111 @@ class SearchConsoleAnalyzer:
         Args:
             n_clusters (int): The number of clusters
         """
-        # Get the queries
-        queries = self.data["Query"].tolist()
-        
-        # Create a TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(max_features=100)
-        
-        # Transform the queries
-        tfidf_matrix = vectorizer.fit_transform(queries)
-        
-        # Cluster the queries
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+        # Get the unique queries; the same query repeats across dates and
+        # pages, so clustering the distinct values is much cheaper
+        unique_queries = self.data["Query"].drop_duplicates().reset_index(drop=True)
+
+        # Deduplication can leave fewer samples than the requested cluster
+        # count; KMeans rejects that, so clamp to the distinct-query count
+        n_clusters = min(n_clusters, len(unique_queries))
+        if n_clusters == 0:
+            self.data["Cluster"] = np.array([], dtype="int32")
+            self._page_cluster_agg = None
+            self.clusters = []
+            return
+
+        # Create a hashing vectorizer (stateless, so no vocabulary-building pass)
+        vectorizer = HashingVectorizer(n_features=256, alternate_sign=False, norm="l2")
+
+        # Transform the queries in a single pass
+        tfidf_matrix = vectorizer.transform(unique_queries)
+
+        # Cluster the queries; rows are L2-normalized, so the Euclidean
+        # distances MiniBatchKMeans minimizes are equivalent to cosine
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, batch_size=4096, n_init=3, max_iter=100)
         clusters = kmeans.fit_predict(tfidf_matrix)
+
+        # Broadcast the labels back to every row via a hash join
+        label_map = pd.Series(clusters, index=unique_queries)
+        self.data["Cluster"] = self.data["Query"].map(label_map).astype("int32")
+
+        # Cache the Landing-Page x Cluster aggregate for identify_topics
+        self._page_cluster_agg = self.data.groupby(["Landing Page", "Cluster"], sort=False, observed=True)["Impressions"].sum().reset_index()
         
-        # Add the cluster to the data
-        self.data["Cluster"] = clusters
-        
-        # Extract cluster information
+        # Get the top 5 queries by impressions per cluster
+        top_queries = self.data.sort_values("Impressions", ascending=False).groupby("Cluster")["Query"].apply(
+            lambda queries: queries.head(5).tolist()
+        )
+
+        # Extract cluster information, skipping empty clusters
         cluster_data = []
-        
-        for cluster_id in range(n_clusters):
-            # Get the queries in this cluster
-            cluster_queries = self.data[self.data["Cluster"] == cluster_id]
-            
-            # Skip empty clusters
-            if len(cluster_queries) == 0:
-                continue
-            
-            # Get the top 5 queries by impressions
-            top_queries = cluster_queries.sort_values("Impressions", ascending=False).head(5)["Query"].tolist()
-            
-            # Calculate metrics for this cluster
-            impressions = cluster_queries["Impressions"].sum()
-            clicks = cluster_queries["Url Clicks"].sum()
-            avg_position = cluster_queries["Average Position"].mean()
-            
-            # Add the cluster to the list
-            cluster_data.append({
-                "cluster_id": cluster_id,
-                "queries": len(cluster_queries),
-                "impressions": impressions,
-                "clicks": clicks,
-                "avg_position": avg_position,
-                "top_queries": top_queries,
-            })
-        
+
+        if numba is not None:
+            # Aggregate per-cluster metrics in one compiled scan
+            counts, impression_sums, click_sums, position_sums = _cluster_reduce(
+                self.data["Cluster"].to_numpy(np.int64),
+                self.data["Impressions"].to_numpy(np.int64),
+                self.data["Url Clicks"].to_numpy(np.int64),
+                self.data["Average Position"].to_numpy(np.float64),
+                n_clusters,
+            )
+
+            for cluster_id in range(n_clusters):
+                count = int(counts[cluster_id])
+
+                if count == 0:
+                    continue
+
+                cluster_data.append({
+                    "cluster_id": cluster_id,
+                    "queries": count,
+                    "impressions": int(impression_sums[cluster_id]),
+                    "clicks": int(click_sums[cluster_id]),
+                    "avg_position": position_sums[cluster_id] / count,
+                    "top_queries": top_queries[cluster_id],
+                })
+        else:
+            # Aggregate per-cluster metrics in a single groupby pass
+            cluster_agg = self.data.groupby("Cluster").agg(
+                queries=("Query", "size"),
+                impressions=("Impressions", "sum"),
+                clicks=("Url Clicks", "sum"),
+                avg_position=("Average Position", "mean"),
+            )
+
+            for row in cluster_agg.itertuples():
+                cluster_data.append({
+                    "cluster_id": int(row.Index),
+                    "queries": int(row.queries),
+                    "impressions": row.impressions,
+                    "clicks": row.clicks,
+                    "avg_position": row.avg_position,
+                    "top_queries": top_queries[row.Index],
+                })
+
         # Sort clusters by impressions in descending order
         self.clusters = sorted(cluster_data, key=lambda x: x["impressions"], reverse=True)
     
     def identify_topics(self):
         """Identify topics for landing pages based on clustered queries."""
-        # Group by landing page and cluster
-        landing_page_clusters = self.data.groupby(["Landing Page", "Cluster"]).agg({
-            "Impressions": "sum",
-        }).reset_index()
-        
-        # Find the dominant cluster for each landing page
-        for landing_page in self.data["Landing Page"].unique():
-            # Get the clusters for this landing page
-            page_clusters = landing_page_clusters[landing_page_clusters["Landing Page"] == landing_page]
-            
-            # Skip landing pages with no clusters
-            if len(page_clusters) == 0:
-                continue
-            
-            # Find the dominant cluster
-            dominant_cluster = page_clusters.loc[page_clusters["Impressions"].idxmax()]["Cluster"]
-            
-            # Get the top queries for this cluster
-            cluster_data = next((c for c in self.clusters if c["cluster_id"] == dominant_cluster), None)
-            
-            if cluster_data:
-                # Use the top queries as the topic
-                self.topics[landing_page] = cluster_data["top_queries"]
+        # Sum impressions per landing page and cluster, reusing the
+        # aggregate cached by cluster_queries when available
+        if self._page_cluster_agg is not None:
+            landing_page_clusters = self._page_cluster_agg
+        else:
+            landing_page_clusters = self.data.groupby(["Landing Page", "Cluster"], sort=False, observed=True)["Impressions"].sum().reset_index()
+
+        # Find the dominant cluster for each landing page in one idxmax pass
+        dominant = landing_page_clusters.loc[landing_page_clusters.groupby("Landing Page")["Impressions"].idxmax()]
+
+        # Map each dominant cluster to the top queries of that cluster
+        cluster_top_queries = {c["cluster_id"]: c["top_queries"] for c in self.clusters}
+
+        self.topics = {
+            landing_page: cluster_top_queries[cluster_id]
+            for landing_page, cluster_id in zip(dominant["Landing Page"], dominant["Cluster"])
+            if cluster_id in cluster_top_queries
+        }
     
     def get_clusters(self):
         """
@@ -339,42 +552,45 @@ class SearchConsoleAnalyzer:
         """
         return self.topics.get(landing_page, [])
     
-    def suggest_internal_links(self):
+    def suggest_internal_links(self, max_pairs_per_topic=None):
         """
         Suggest internal links based on topics.
-        
+
+        Args:
+            max_pairs_per_topic (int): Optional cap on the suggestions per topic
+
         Returns:
             list: The suggested links
         """
         suggestions = []
-        
-        # Group landing pages by topic
+
+        # Group landing pages by topic, keyed by tuple so no string is
+        # built (or hashed) per landing page
         topic_pages = {}
-        
+
         for landing_page, topic in self.topics.items():
-            # Convert the topic to a string for grouping
-            topic_str = ", ".join(topic)
-            
-            if topic_str not in topic_pages:
-                topic_pages[topic_str] = []
-            
-            topic_pages[topic_str].append(landing_page)
-        
+            topic_pages.setdefault(tuple(topic), []).append(landing_page)
+
         # Suggest links between pages with the same topic
-        for topic, pages in topic_pages.items():
+        for topic_key, pages in topic_pages.items():
             # Skip topics with only one page
             if len(pages) <= 1:
                 continue
-            
-            # Suggest links between all pages
-            for i, source in enumerate(pages):
-                for target in pages[i+1:]:
-                    suggestions.append({
-                        "source": source,
-                        "target": target,
-                        "topic": topic,
-                    })
-        
+
+            # Format the display string once per topic, not once per page
+            topic_str = ", ".join(topic_key)
+
+            # Suggest links between all pairs of pages
+            pairs = combinations(pages, 2)
+
+            if max_pairs_per_topic is not None:
+                pairs = islice(pairs, max_pairs_per_topic)
+
+            suggestions.extend(
+                {"source": source, "target": target, "topic": topic_str}
+                for source, target in pairs
+            )
+
         return suggestions
     
     def to_dataframe(self):
@@ -403,7 +619,12 @@ class SearchConsoleComparison:
         
         self.query_comparison = None
         self.landing_page_comparison = None
-        
+
+        self._improved_queries = None
+        self._declined_queries = None
+        self._improved_landing_pages = None
+        self._declined_landing_pages = None
+
         self.logger = logging.getLogger(__name__)
     
     def compare(self):
@@ -414,13 +635,17 @@ class SearchConsoleComparison:
             dict: The comparison results
         """
         self.logger.info("Comparing Search Console datasets")
-        
-        # Compare queries
-        self.compare_queries()
-        
-        # Compare landing pages
-        self.compare_landing_pages()
-        
+
+        # Compare queries and landing pages concurrently; the two methods
+        # read independent aggregates and write to distinct attributes,
+        # and pandas releases the GIL inside the join/arithmetic kernels
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            query_future = executor.submit(self.compare_queries)
+            landing_page_future = executor.submit(self.compare_landing_pages)
+
+            query_future.result()
+            landing_page_future.result()
+
         # Return the results
         return {
             "query_comparison": self.query_comparison,
@@ -429,83 +654,77 @@ class SearchConsoleComparison:
     
     def compare_queries(self):
         """Compare queries between the two datasets."""
-        # Get the data
-        old_data = self.old_data.get_data()
-        new_data = self.new_data.get_data()
-        
-        # Group by query and aggregate metrics
-        old_queries = old_data.groupby("Query").agg({
-            "Impressions": "sum",
-            "Url Clicks": "sum",
-            "Average Position": "mean",
-        }).reset_index()
-        
-        new_queries = new_data.groupby("Query").agg({
-            "Impressions": "sum",
-            "Url Clicks": "sum",
-            "Average Position": "mean",
-        }).reset_index()
-        
-        # Merge the data
-        merged = pd.merge(old_queries, new_queries, on="Query", how="outer", suffixes=("_old", "_new"))
-        
-        # Fill missing values with 0
-        merged = merged.fillna(0)
-        
-        # Calculate changes
-        merged["Impressions_change"] = merged["Impressions_new"] - merged["Impressions_old"]
-        merged["Impressions_change_pct"] = (merged["Impressions_change"] / merged["Impressions_old"]) * 100
-        merged["Url Clicks_change"] = merged["Url Clicks_new"] - merged["Url Clicks_old"]
-        merged["Url Clicks_change_pct"] = (merged["Url Clicks_change"] / merged["Url Clicks_old"]) * 100
-        merged["Average Position_change"] = merged["Average Position_new"] - merged["Average Position_old"]
-        
-        # Replace infinity with 0
-        merged = merged.replace([np.inf, -np.inf], 0)
+        # Reuse the per-query aggregates already materialized by the loaders
+        old_queries = self.old_data.get_query_agg()
+        new_queries = self.new_data.get_query_agg()
+
+        # Join on the unique Query index; suffixes are applied up front so
+        # no overlap resolution or column rename pass is needed
+        old_queries = old_queries.set_index("Query").rename(columns=lambda c: c + "_old")
+        new_queries = new_queries.set_index("Query").rename(columns=lambda c: c + "_new")
+
+        merged = old_queries.join(new_queries, how="outer").fillna(0).reset_index()
         
+        # Calculate changes (safe division: rows with no old value get 0%)
+        for column in ("Impressions", "Url Clicks"):
+            old_values = merged[f"{column}_old"].to_numpy(dtype=np.float64)
+            new_values = merged[f"{column}_new"].to_numpy(dtype=np.float64)
+
+            change = new_values - old_values
+            change_pct = np.zeros_like(change)
+            np.divide(change * 100.0, old_values, out=change_pct, where=old_values != 0)
+
+            merged[f"{column}_change"] = change
+            merged[f"{column}_change_pct"] = change_pct
+
+        merged["Average Position_change"] = merged["Average Position_new"] - merged["Average Position_old"]
+
         # Sort by impressions change in descending order
         merged = merged.sort_values("Impressions_change", ascending=False)
-        
+
+        # Split improved/declined once so the getters don't rescan
+        change_sign = np.sign(merged["Impressions_change"].to_numpy())
+        self._improved_queries = merged[change_sign > 0]
+        self._declined_queries = merged[change_sign < 0]
+
         # Store the comparison
         self.query_comparison = merged
-    
+
     def compare_landing_pages(self):
         """Compare landing pages between the two datasets."""
-        # Get the data
-        old_data = self.old_data.get_data()
-        new_data = self.new_data.get_data()
-        
-        # Group by landing page and aggregate metrics
-        old_landing_pages = old_data.groupby("Landing Page").agg({
-            "Impressions": "sum",
-            "Url Clicks": "sum",
-            "Average Position": "mean",
-        }).reset_index()
-        
-        new_landing_pages = new_data.groupby("Landing Page").agg({
-            "Impressions": "sum",
-            "Url Clicks": "sum",
-            "Average Position": "mean",
-        }).reset_index()
-        
-        # Merge the data
-        merged = pd.merge(old_landing_pages, new_landing_pages, on="Landing Page", how="outer", suffixes=("_old", "_new"))
-        
-        # Fill missing values with 0
-        merged = merged.fillna(0)
-        
-        # Calculate changes
-        merged["Impressions_change"] = merged["Impressions_new"] - merged["Impressions_old"]
-        merged["Impressions_change_pct"] = (merged["Impressions_change"] / merged["Impressions_old"]) * 100
-        merged["Url Clicks_change"] = merged["Url Clicks_new"] - merged["Url Clicks_old"]
-        merged["Url Clicks_change_pct"] = (merged["Url Clicks_change"] / merged["Url Clicks_old"]) * 100
-        merged["Average Position_change"] = merged["Average Position_new"] - merged["Average Position_old"]
-        
-        # Replace infinity with 0
-        merged = merged.replace([np.inf, -np.inf], 0)
+        # Reuse the per-landing-page aggregates already materialized by the loaders
+        old_landing_pages = self.old_data.get_landing_agg()
+        new_landing_pages = self.new_data.get_landing_agg()
+
+        # Join on the unique Landing Page index; suffixes are applied up
+        # front so no overlap resolution or column rename pass is needed
+        old_landing_pages = old_landing_pages.set_index("Landing Page").rename(columns=lambda c: c + "_old")
+        new_landing_pages = new_landing_pages.set_index("Landing Page").rename(columns=lambda c: c + "_new")
+
+        merged = old_landing_pages.join(new_landing_pages, how="outer").fillna(0).reset_index()
         
+        # Calculate changes (safe division: rows with no old value get 0%)
+        for column in ("Impressions", "Url Clicks"):
+            old_values = merged[f"{column}_old"].to_numpy(dtype=np.float64)
+            new_values = merged[f"{column}_new"].to_numpy(dtype=np.float64)
+
+            change = new_values - old_values
+            change_pct = np.zeros_like(change)
+            np.divide(change * 100.0, old_values, out=change_pct, where=old_values != 0)
+
+            merged[f"{column}_change"] = change
+            merged[f"{column}_change_pct"] = change_pct
+
+        merged["Average Position_change"] = merged["Average Position_new"] - merged["Average Position_old"]
+
         # Sort by impressions change in descending order
         merged = merged.sort_values("Impressions_change", ascending=False)
-        
+
+        # Split improved/declined once so the getters don't rescan
+        change_sign = np.sign(merged["Impressions_change"].to_numpy())
+        self._improved_landing_pages = merged[change_sign > 0]
+        self._declined_landing_pages = merged[change_sign < 0]
+
         # Store the comparison
         self.landing_page_comparison = merged
     
@@ -534,7 +753,7 @@ class SearchConsoleComparison:
         Returns:
             pandas.DataFrame: The improved queries
         """
-        return self.query_comparison[self.query_comparison["Impressions_change"] > 0]
+        return self._improved_queries
     
     def get_declined_queries(self):
         """
@@ -543,7 +762,7 @@ class SearchConsoleComparison:
         Returns:
             pandas.DataFrame: The declined queries
         """
-        return self.query_comparison[self.query_comparison["Impressions_change"] < 0]
+        return self._declined_queries
     
     def get_improved_landing_pages(self):
         """
@@ -552,7 +771,7 @@ class SearchConsoleComparison:
         Returns:
             pandas.DataFrame: The improved landing pages
         """
-        return self.landing_page_comparison[self.landing_page_comparison["Impressions_change"] > 0]
+        return self._improved_landing_pages
     
     def get_declined_landing_pages(self):
         """
@@ -561,7 +780,7 @@ class SearchConsoleComparison:
         Returns:
             pandas.DataFrame: The declined landing pages
         """
-        return self.landing_page_comparison[self.landing_page_comparison["Impressions_change"] < 0]
+        return self._declined_landing_pages
     
     def to_dataframe(self):
         """
@@ -9,8 +9,10 @@ Contains classes for loading and analyzing SEMrush data.
 import logging
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import normalize
 from collections import Counter
 import re
 import os
@@ -28,35 +30,96 @@ class SEMrushData:
         """
         self.file_path = file_path
         self.data = None
-        self.keywords = []
-        self.urls = []
-        
+
+        self._keyword_df = None
+        self._url_df = None
+        self._keywords = None
+        self._urls = None
+        self._keyword_index = None
+        self._url_index = None
+
         self.logger = logging.getLogger(__name__)
-    
-    def load(self):
+
+    @property
+    def keywords(self):
+        """list: The aggregated keyword records, materialized on first access."""
+        if self._keywords is None and self._keyword_df is not None:
+            self._keywords = self._keyword_df.to_dict("records")
+        return self._keywords if self._keywords is not None else []
+
+    @property
+    def urls(self):
+        """list: The aggregated URL records, materialized on first access."""
+        if self._urls is None and self._url_df is not None:
+            self._urls = self._url_df.to_dict("records")
+        return self._urls if self._urls is not None else []
+
+    def load(self, records=False):
         """
         Load the SEMrush data.
-        
+
+        Args:
+            records (bool): Include the per-keyword/per-URL record lists
+                in the result (they are expensive to materialize)
+
         Returns:
             dict: The load results
         """
         self.logger.info(f"Loading SEMrush data from: {self.file_path}")
         
+        required_columns = ["Keyword", "Position", "Search Volume", "URL", "Traffic"]
+
         try:
-            # Load the CSV file
-            self.data = pd.read_csv(self.file_path)
-            
-            # Check if the required columns are present
-            required_columns = ["Keyword", "Position", "Search Volume", "URL", "Traffic"]
-            
+            # Probe the header first so malformed files fail before a full parse
+            header = pd.read_csv(self.file_path, nrows=1)
+
             for column in required_columns:
-                if column not in self.data.columns:
+                if column not in header.columns:
                     self.logger.error(f"Required column not found: {column}")
                     return {
                         "success": False,
                         "message": f"Required column not found: {column}",
                     }
-            
+
+            # Only parse the columns that are used (keep Topic when present)
+            use_columns = list(required_columns)
+            if "Topic" in header.columns:
+                use_columns.append("Topic")
+
+            # Stream the file in bounded chunks, dropping incomplete rows
+            # per chunk so peak memory stays proportional to the kept data
+            dtypes = {
+                "Keyword": "string",
+                "URL": "string",
+                "Position": "float32",
+                "Search Volume": "float32",
+                "Traffic": "float32",
+            }
+
+            # Common placeholder values in the numeric columns parse to NaN
+            # instead of bouncing the whole file to the untyped fallback
+            na_values = {
+                "Position": ["", "NA", "N/A", "-"],
+                "Search Volume": ["", "NA", "N/A", "-"],
+                "Traffic": ["", "NA", "N/A", "-"],
+            }
+
+            try:
+                chunks = [
+                    chunk.dropna(subset=required_columns)
+                    for chunk in pd.read_csv(
+                        self.file_path, usecols=use_columns, dtype=dtypes, na_values=na_values, chunksize=200_000
+                    )
+                ]
+            except (ValueError, TypeError):
+                # The schema doesn't fit; reparse untyped and let clean_data coerce
+                chunks = [
+                    chunk.dropna(subset=required_columns)
+                    for chunk in pd.read_csv(self.file_path, usecols=use_columns, chunksize=200_000)
+                ]
+
+            self.data = pd.concat(chunks, ignore_index=True)
+
             # Clean the data
             self.clean_data()
             
@@ -64,17 +127,22 @@ class SEMrushData:
             self.extract_keywords_and_urls()
             
             # Return the results
-            return {
+            result = {
                 "success": True,
                 "message": "SEMrush data loaded successfully",
                 "file_path": self.file_path,
-                "total_keywords": len(self.keywords),
-                "total_urls": len(self.urls),
+                "total_keywords": len(self._keyword_df),
+                "total_urls": len(self._url_df),
                 "total_traffic": self.data["Traffic"].sum(),
                 "avg_position": self.data["Position"].mean(),
-                "keywords": self.keywords,
-                "urls": self.urls,
             }
+
+            # Only build the per-row record lists when asked to
+            if records:
+                result["keywords"] = self.keywords
+                result["urls"] = self.urls
+
+            return result
         except Exception as e:
             self.logger.error(f"Error loading SEMrush data: {str(e)}")
             return {
@@ -84,17 +152,35 @@ class SEMrushData:
     
     def clean_data(self):
         """Clean the SEMrush data."""
-        # Remove rows with missing values
+        # The row positions are about to change; rebuild lookups lazily
+        self._keyword_index = None
+        self._url_index = None
+
+        # The typed read_csv path already parsed the metrics as float32 with
+        # bad values mapped to NaN; only the untyped fallback still needs a
+        # coercion pass here
+        needs_coercion = [
+            column
+            for column in ("Position", "Search Volume", "Traffic")
+            if self.data[column].dtype != np.float32
+        ]
+
+        for column in needs_coercion:
+            self.data[column] = pd.to_numeric(self.data[column], errors="coerce")
+
+        # One pass drops rows missing any required or just-coerced value
         self.data = self.data.dropna(subset=["Keyword", "Position", "Search Volume", "URL", "Traffic"])
-        
-        # Convert numeric columns to numeric types
-        self.data["Position"] = pd.to_numeric(self.data["Position"], errors="coerce")
-        self.data["Search Volume"] = pd.to_numeric(self.data["Search Volume"], errors="coerce")
-        self.data["Traffic"] = pd.to_numeric(self.data["Traffic"], errors="coerce")
-        
-        # Remove rows with invalid numeric values
-        self.data = self.data.dropna(subset=["Position", "Search Volume", "Traffic"])
-        
+
+        # Halve the numeric element width; float32 holds these metrics
+        # exactly and doubles the effective bandwidth of every aggregation
+        for column in needs_coercion:
+            self.data[column] = self.data[column].astype("float32")
+
+        # Store the repeated string columns as category codes, so groupby
+        # and unique() hash small integers instead of Python strings
+        for column in ("URL", "Keyword"):
+            self.data[column] = self.data[column].astype("category")
+
         # Add a Topic column if it doesn't exist
         if "Topic" not in self.data.columns:
             self.data["Topic"] = ""
@@ -110,21 +196,22 @@ class SEMrushData:
         
         # Sort by traffic in descending order
         keyword_data = keyword_data.sort_values("Traffic", ascending=False)
-        
-        # Convert to list of dictionaries
-        self.keywords = keyword_data.to_dict("records")
-        
+
         # Group by URL and aggregate metrics
         url_data = self.data.groupby("URL").agg({
             "Position": "mean",
             "Traffic": "sum",
         }).reset_index()
-        
+
         # Sort by traffic in descending order
         url_data = url_data.sort_values("Traffic", ascending=False)
-        
-        # Convert to list of dictionaries
-        self.urls = url_data.to_dict("records")
+
+        # Keep the frames as the source of truth; the record lists are
+        # built lazily by the keywords/urls properties
+        self._keyword_df = keyword_data
+        self._url_df = url_data
+        self._keywords = None
+        self._urls = None
     
     def get_data(self):
         """
@@ -163,7 +250,14 @@ class SEMrushData:
         Returns:
             pandas.DataFrame: The data for the keyword
         """
-        return self.data[self.data["Keyword"] == keyword]
+        # Build the row-position index once; later calls are O(1) lookups
+        if self._keyword_index is None:
+            self._keyword_index = self.data.groupby("Keyword", sort=False, observed=True).indices
+
+        if keyword not in self._keyword_index:
+            return self.data.iloc[0:0]
+
+        return self.data.take(self._keyword_index[keyword])
     
     def get_url_data(self, url):
         """
@@ -175,7 +269,13 @@ class SEMrushData:
         Returns:
             pandas.DataFrame: The data for the URL
         """
-        return self.data[self.data["URL"] == url]
+        if self._url_index is None:
+            self._url_index = self.data.groupby("URL", sort=False, observed=True).indices
+
+        if url not in self._url_index:
+            return self.data.iloc[0:0]
+
+        return self.data.take(self._url_index[url])
     
     def to_dataframe(self):
         """
@@ -204,7 +304,13 @@ class SEMrushAnalyzer:
         self.topics = {}
         self.visibility = {}
         self.traffic = {}
-        
+
+        self._tfidf = None
+        self._vectorizer = None
+        self._url_cluster = {}
+        self._cluster_top_keywords = {}
+        self._analysis_cache = {}
+
         self.logger = logging.getLogger(__name__)
     
     def analyze(self):
@@ -215,16 +321,48 @@ class SEMrushAnalyzer:
             dict: The analysis results
         """
         self.logger.info("Analyzing SEMrush data")
-        
-        # Cluster keywords
-        self.cluster_keywords()
-        
-        # Identify topics
-        self.identify_topics()
-        
-        # Calculate visibility and traffic per topic
-        self.calculate_visibility_and_traffic()
-        
+
+        # Fingerprint every column the analysis consumes; hashing is O(N)
+        # and memory-bound, far cheaper than re-running TF-IDF + KMeans on
+        # unchanged data
+        consumed = ["Keyword", "Position", "Search Volume", "URL", "Traffic"]
+        fingerprint = (
+            len(self.data),
+            int(pd.util.hash_pandas_object(self.data[consumed], index=False).sum()),
+        )
+
+        if fingerprint in self._analysis_cache:
+            # Restore the internal mappings too, so suggest_internal_links
+            # works against the same dataset as the restored topics
+            (
+                self.clusters,
+                self.topics,
+                self.visibility,
+                self.traffic,
+                self._url_cluster,
+                self._cluster_top_keywords,
+                self._tfidf,
+            ) = self._analysis_cache[fingerprint]
+        else:
+            # Cluster keywords
+            self.cluster_keywords()
+
+            # Identify topics
+            self.identify_topics()
+
+            # Calculate visibility and traffic per topic
+            self.calculate_visibility_and_traffic()
+
+            self._analysis_cache[fingerprint] = (
+                self.clusters,
+                self.topics,
+                self.visibility,
+                self.traffic,
+                self._url_cluster,
+                self._cluster_top_keywords,
+                self._tfidf,
+            )
+
         # Return the results
         return {
             "clusters": self.clusters,
@@ -242,46 +380,74 @@ class SEMrushAnalyzer:
         """
         # Get the keywords
         keywords = self.data["Keyword"].tolist()
-        
-        # Create a TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(max_features=100)
-        
-        # Transform the keywords
-        tfidf_matrix = vectorizer.fit_transform(keywords)
-        
-        # Cluster the keywords
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+
+        # Hash the keywords into a fixed float32 feature space; hashing has
+        # no fit step, so re-analyzing overlapping or streamed datasets
+        # never pays a vocabulary-learning pass
+        if self._vectorizer is None:
+            self._vectorizer = HashingVectorizer(
+                n_features=1024,
+                alternate_sign=False,
+                norm="l2",
+                dtype=np.float32,
+                lowercase=True,
+                token_pattern=r"(?u)\b\w\w+\b",
+            )
+
+        # Transform the keywords; rows are L2-normalized, so dot products
+        # between them are cosine similarities
+        tfidf_matrix = self._vectorizer.transform(keywords)
+        self._tfidf = tfidf_matrix
+        
+        # Cluster the keywords with mini-batch updates on the sparse matrix.
+        # A single k-means++ init is enough here and skips two redundant
+        # restarts; the distance step itself runs on scikit-learn's threaded
+        # BLAS kernels, so it already uses every available core
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, batch_size=4096, n_init=1, max_no_improvement=10)
         clusters = kmeans.fit_predict(tfidf_matrix)
         
-        # Add the cluster to the data
-        self.data["Cluster"] = clusters
+        # Add the cluster to the data as categorical codes
+        self.data["Cluster"] = pd.Categorical.from_codes(clusters, categories=range(n_clusters))
         
+        # Reduce every per-cluster metric in one bincount pass per column;
+        # the labels are a contiguous [0, n_clusters) range, so this
+        # replaces one full-frame boolean mask per cluster
+        traffic_np = self.data["Traffic"].to_numpy(dtype="float64")
+        volume_np = self.data["Search Volume"].to_numpy(dtype="float64")
+        position_np = self.data["Position"].to_numpy(dtype="float64")
+
+        counts = np.bincount(clusters, minlength=n_clusters)
+        traffic_sums = np.bincount(clusters, weights=traffic_np, minlength=n_clusters)
+        volume_sums = np.bincount(clusters, weights=volume_np, minlength=n_clusters)
+        position_sums = np.bincount(clusters, weights=position_np, minlength=n_clusters)
+        avg_positions = position_sums / np.maximum(counts, 1)
+
+        keywords_np = self.data["Keyword"].to_numpy()
+
         # Extract cluster information
         cluster_data = []
-        
+
         for cluster_id in range(n_clusters):
-            # Get the keywords in this cluster
-            cluster_keywords = self.data[self.data["Cluster"] == cluster_id]
-            
             # Skip empty clusters
-            if len(cluster_keywords) == 0:
+            if counts[cluster_id] == 0:
                 continue
-            
-            # Get the top 5 keywords by traffic
-            top_keywords = cluster_keywords.sort_values("Traffic", ascending=False).head(5)["Keyword"].tolist()
-            
-            # Calculate metrics for this cluster
-            traffic = cluster_keywords["Traffic"].sum()
-            avg_position = cluster_keywords["Position"].mean()
-            search_volume = cluster_keywords["Search Volume"].sum()
-            
+
+            # Get the top 5 keywords by traffic; argpartition selects them
+            # in O(n) where a full per-cluster sort would be O(n log n)
+            member_idx = np.flatnonzero(clusters == cluster_id)
+            local_traffic = traffic_np[member_idx]
+            k = min(5, member_idx.size)
+            top_idx = member_idx[np.argpartition(-local_traffic, k - 1)[:k]]
+            top_idx = top_idx[np.argsort(-traffic_np[top_idx], kind="stable")]
+            top_keywords = keywords_np[top_idx].tolist()
+
             # Add the cluster to the list
             cluster_data.append({
                 "cluster_id": cluster_id,
-                "keywords": len(cluster_keywords),
-                "traffic": traffic,
-                "avg_position": avg_position,
-                "search_volume": search_volume,
+                "keywords": int(counts[cluster_id]),
+                "traffic": traffic_sums[cluster_id],
+                "avg_position": avg_positions[cluster_id],
+                "search_volume": volume_sums[cluster_id],
                 "top_keywords": top_keywords,
             })
         
@@ -290,73 +456,67 @@ class SEMrushAnalyzer:
     
     def identify_topics(self):
         """Identify topics for URLs based on clustered keywords."""
-        # Group by URL and cluster
-        url_clusters = self.data.groupby(["URL", "Cluster"]).agg({
-            "Traffic": "sum",
-        }).reset_index()
-        
-        # Find the dominant cluster for each URL
-        for url in self.data["URL"].unique():
-            # Get the clusters for this URL
-            url_clusters_data = url_clusters[url_clusters["URL"] == url]
-            
-            # Skip URLs with no clusters
-            if len(url_clusters_data) == 0:
-                continue
-            
-            # Find the dominant cluster
-            dominant_cluster = url_clusters_data.loc[url_clusters_data["Traffic"].idxmax()]["Cluster"]
-            
-            # Get the top keywords for this cluster
-            cluster_data = next((c for c in self.clusters if c["cluster_id"] == dominant_cluster), None)
-            
-            if cluster_data:
-                # Use the top keywords as the topic
-                self.topics[url] = cluster_data["top_keywords"]
+        # Sum traffic per URL and cluster
+        url_clusters = self.data.groupby(["URL", "Cluster"], sort=False)["Traffic"].sum().reset_index()
+
+        # Find the dominant cluster for each URL in one idxmax pass
+        dominant = url_clusters.loc[url_clusters.groupby("URL")["Traffic"].idxmax()]
+
+        # Map each dominant cluster to the top keywords of that cluster
+        self._cluster_top_keywords = {c["cluster_id"]: c["top_keywords"] for c in self.clusters}
+
+        # Keep the URL -> cluster id mapping as the grouping key; hashing a
+        # small int beats hashing a joined keyword string in the hot paths
+        self._url_cluster = {
+            url: cluster_id
+            for url, cluster_id in zip(dominant["URL"], dominant["Cluster"])
+            if cluster_id in self._cluster_top_keywords
+        }
+
+        self.topics = {
+            url: self._cluster_top_keywords[cluster_id]
+            for url, cluster_id in self._url_cluster.items()
+        }
     
     def calculate_visibility_and_traffic(self):
         """Calculate visibility and traffic per topic."""
-        # Group by topic
-        topic_data = {}
-        
-        for url, topic_keywords in self.topics.items():
-            # Convert the topic to a string for grouping
-            topic_str = ", ".join(topic_keywords)
-            
-            if topic_str not in topic_data:
-                topic_data[topic_str] = {
-                    "urls": [],
-                    "keywords": 0,
-                    "traffic": 0,
-                    "visibility": 0,
-                }
-            
-            # Add the URL to the topic
-            topic_data[topic_str]["urls"].append(url)
-            
-            # Get the keywords for this URL
-            url_keywords = self.data[self.data["URL"] == url]
-            
-            # Add the number of keywords
-            topic_data[topic_str]["keywords"] += len(url_keywords)
-            
-            # Add the traffic
-            topic_data[topic_str]["traffic"] += url_keywords["Traffic"].sum()
-            
-            # Calculate visibility (percentage of keywords in top 10)
-            top_10_keywords = len(url_keywords[url_keywords["Position"] <= 10])
-            visibility = (top_10_keywords / len(url_keywords)) * 100 if len(url_keywords) > 0 else 0
-            
-            # Add the visibility
-            topic_data[topic_str]["visibility"] += visibility
-        
-        # Calculate average visibility per topic
-        for topic, data in topic_data.items():
-            data["visibility"] = data["visibility"] / len(data["urls"]) if len(data["urls"]) > 0 else 0
-        
-        # Store the results
-        self.visibility = {topic: data["visibility"] for topic, data in topic_data.items()}
-        self.traffic = {topic: data["traffic"] for topic, data in topic_data.items()}
+        # Aggregate per-URL metrics once: keyword count, traffic sum and
+        # how many keywords rank in the top 10
+        url_agg = self.data.assign(_top10=self.data["Position"] <= 10).groupby("URL").agg(
+            keywords=("Keyword", "size"),
+            traffic=("Traffic", "sum"),
+            top10=("_top10", "sum"),
+        )
+
+        # Attach each URL's dominant cluster and reduce per topic in one
+        # groupby pass instead of a Python loop over the topic mapping
+        cluster_of_url = pd.Series(self._url_cluster, name="cluster")
+        url_agg = url_agg.join(cluster_of_url, how="inner")
+
+        # Per-URL visibility: percentage of keywords ranking in the top 10
+        keyword_count = url_agg["keywords"].to_numpy(dtype="float64")
+        url_agg["visibility"] = np.divide(
+            url_agg["top10"].to_numpy(dtype="float64") * 100,
+            keyword_count,
+            out=np.zeros_like(keyword_count),
+            where=keyword_count > 0,
+        )
+
+        # Topic visibility is the mean per-URL visibility; traffic is summed
+        topic_agg = url_agg.groupby("cluster", observed=True).agg(
+            traffic=("traffic", "sum"),
+            visibility=("visibility", "mean"),
+        )
+
+        # Store the results under the human-readable topic string
+        self.visibility = {
+            ", ".join(self._cluster_top_keywords[cluster_id]): visibility
+            for cluster_id, visibility in topic_agg["visibility"].items()
+        }
+        self.traffic = {
+            ", ".join(self._cluster_top_keywords[cluster_id]): traffic
+            for cluster_id, traffic in topic_agg["traffic"].items()
+        }
     
     def get_clusters(self):
         """
@@ -406,42 +566,89 @@ class SEMrushAnalyzer:
         """
         return self.traffic
     
-    def suggest_internal_links(self):
+    def _url_similarity(self):
+        """
+        Compute cosine similarity between per-URL keyword centroids.
+
+        Returns:
+            tuple: (dict mapping URL to matrix row, similarity matrix)
+        """
+        # Sum the normalized keyword rows per URL into centroid vectors
+        url_codes, urls = pd.factorize(self.data["URL"])
+
+        weights = sparse.csr_matrix(
+            (np.ones(len(url_codes)), (url_codes, np.arange(len(url_codes)))),
+            shape=(len(urls), self._tfidf.shape[0]),
+        )
+        centroids = normalize(weights @ self._tfidf)
+
+        # One sparse matrix product gives every pairwise cosine similarity
+        similarity = (centroids @ centroids.T).toarray()
+
+        return {url: row for row, url in enumerate(urls)}, similarity
+
+    def suggest_internal_links(self, similarity_threshold=None):
         """
         Suggest internal links based on topics.
-        
+
+        Args:
+            similarity_threshold (float): Optional minimum cosine similarity
+                between the keyword centroids of the two URLs
+
         Returns:
             list: The suggested links
         """
         suggestions = []
-        
-        # Group URLs by topic
+
+        # Score pairs by keyword-centroid cosine similarity when available
+        url_rows = similarity = None
+
+        if self._tfidf is not None:
+            url_rows, similarity = self._url_similarity()
+
+        # Group URLs by cluster id; ints hash cheaper than joined strings
         topic_urls = {}
-        
-        for url, topic in self.topics.items():
-            # Convert the topic to a string for grouping
-            topic_str = ", ".join(topic)
-            
-            if topic_str not in topic_urls:
-                topic_urls[topic_str] = []
-            
-            topic_urls[topic_str].append(url)
-        
+
+        for url, cluster_id in self._url_cluster.items():
+            if cluster_id not in topic_urls:
+                topic_urls[cluster_id] = []
+
+            topic_urls[cluster_id].append(url)
+
         # Suggest links between URLs with the same topic
-        for topic, urls in topic_urls.items():
+        for cluster_id, urls in topic_urls.items():
             # Skip topics with only one URL
             if len(urls) <= 1:
                 continue
-            
-            # Suggest links between all URLs
-            for i, source in enumerate(urls):
-                for target in urls[i+1:]:
-                    suggestions.append({
-                        "source": source,
-                        "target": target,
-                        "topic": topic,
-                    })
-        
+
+            # Render the keyword string once per topic, not once per pair
+            topic = ", ".join(self._cluster_top_keywords[cluster_id])
+
+            # Enumerate all pairs at C speed
+            url_array = np.asarray(urls, dtype=object)
+            source_idx, target_idx = np.triu_indices(len(url_array), k=1)
+            sources = url_array[source_idx]
+            targets = url_array[target_idx]
+
+            if similarity is not None:
+                # Gather all pair scores with one fancy-index lookup
+                rows = np.asarray([url_rows[url] for url in urls])
+                scores = similarity[rows[source_idx], rows[target_idx]]
+
+                if similarity_threshold is not None:
+                    keep = scores >= similarity_threshold
+                    sources, targets, scores = sources[keep], targets[keep], scores[keep]
+
+                suggestions.extend(
+                    {"source": source, "target": target, "topic": topic, "similarity": float(score)}
+                    for source, target, score in zip(sources, targets, scores)
+                )
+            else:
+                suggestions.extend(
+                    {"source": source, "target": target, "topic": topic}
+                    for source, target in zip(sources, targets)
+                )
+
         return suggestions
     
     def to_dataframe(self):
@@ -6,10 +6,36 @@ URL validator module for the SEO Analysis Tool.
 Contains classes for validating and normalizing URLs.
 """
 
+import functools
 import logging
 import re
 from urllib.parse import urlparse, urljoin, urlunparse
 
+
+# File extension at the end of a URL path, tolerating a query or fragment
+_EXT_RE = re.compile(r"\.([A-Za-z0-9]{1,5})(?:$|[?#])")
+
+_IMAGE_EXTS = frozenset({"jpg", "jpeg", "png", "gif", "webp", "svg", "ico"})
+_HTML_EXTS = frozenset({"html", "htm"})
+
+
+@functools.lru_cache(maxsize=100_000)
+def _parse(url):
+    """
+    Parse a URL, memoizing the result.
+
+    The crawler inspects the same URL through several predicates in a row,
+    so caching the immutable ParseResult collapses the repeated parses.
+
+    Args:
+        url (str): The URL to parse
+
+    Returns:
+        urllib.parse.ParseResult: The parsed URL
+    """
+    return urlparse(url)
+
+
 class SEOURLValidator:
     """Class for validating and normalizing URLs."""
     
@@ -26,7 +52,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Check if the URL has a scheme and netloc
             return bool(parsed_url.scheme and parsed_url.netloc)
@@ -46,7 +72,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Normalize the scheme
             scheme = parsed_url.scheme.lower() or "http"
@@ -86,8 +112,8 @@ class SEOURLValidator:
         """
         try:
             # Parse the URLs
-            parsed_base_url = urlparse(base_url)
-            parsed_url = urlparse(url)
+            parsed_base_url = _parse(base_url)
+            parsed_url = _parse(url)
             
             # Check if the netloc is the same
             return parsed_base_url.netloc == parsed_url.netloc
@@ -107,7 +133,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Get the netloc
             netloc = parsed_url.netloc.lower()
@@ -133,7 +159,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Get the path
             path = parsed_url.path
@@ -155,7 +181,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Get the query
             query = parsed_url.query
@@ -177,7 +203,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Reconstruct the URL without the query
             url_without_query = urlunparse((parsed_url.scheme, parsed_url.netloc, parsed_url.path, parsed_url.params, "", ""))
@@ -199,7 +225,7 @@ class SEOURLValidator:
         """
         try:
             # Parse the URL
-            parsed_url = urlparse(url)
+            parsed_url = _parse(url)
             
             # Reconstruct the URL without the fragment
             url_without_fragment = urlunparse((parsed_url.scheme, parsed_url.netloc, parsed_url.path, parsed_url.params, parsed_url.query, ""))
@@ -208,28 +234,49 @@ class SEOURLValidator:
         except Exception:
             return url
     
+    @staticmethod
+    def _page_key(parsed):
+        """
+        Build a comparable tuple identifying the page a parsed URL points to.
+
+        Applies the same normalization as normalize_url (scheme/netloc case,
+        default ports, bare-slash path) and ignores the fragment, without
+        round-tripping through urlunparse.
+
+        Args:
+            parsed (urllib.parse.ParseResult): The parsed URL
+
+        Returns:
+            tuple: The page identity key
+        """
+        scheme = parsed.scheme.lower() or "http"
+        netloc = parsed.netloc.lower()
+
+        if netloc.endswith(":80") and scheme == "http":
+            netloc = netloc[:-3]
+        elif netloc.endswith(":443") and scheme == "https":
+            netloc = netloc[:-4]
+
+        path = "" if parsed.path == "/" else parsed.path
+
+        return (scheme, netloc, path, parsed.params, parsed.query)
+
     @staticmethod
     def is_same_page(url1, url2):
         """
         Check if two URLs point to the same page.
-        
+
         Args:
             url1 (str): The first URL
             url2 (str): The second URL
-        
+
         Returns:
             bool: True if the URLs point to the same page, False otherwise
         """
         try:
-            # Normalize the URLs
-            url1 = SEOURLValidator.normalize_url(url1)
-            url2 = SEOURLValidator.normalize_url(url2)
-            
-            # Remove fragments
-            url1 = SEOURLValidator.remove_fragment(url1)
-            url2 = SEOURLValidator.remove_fragment(url2)
-            
-            return url1 == url2
+            # Compare normalized page keys directly; one parse per URL
+            # instead of the normalize + remove_fragment round-trips
+            return SEOURLValidator._page_key(_parse(url1)) == SEOURLValidator._page_key(_parse(url2))
         except Exception:
             return False
     
@@ -267,127 +314,135 @@ class SEOURLValidator:
         except Exception:
             return False
     
+    @staticmethod
+    def _url_extension(url):
+        """
+        Get the lowercased file extension of a URL, or "" if it has none.
+
+        Args:
+            url (str): The URL
+
+        Returns:
+            str: The extension without the leading dot
+        """
+        match = _EXT_RE.search(url)
+        return match.group(1).lower() if match else ""
+
     @staticmethod
     def is_image_url(url):
         """
         Check if a URL is an image URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is an image URL, False otherwise
         """
         try:
-            # Check if the URL ends with an image extension
-            image_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".ico"]
-            
-            for ext in image_extensions:
-                if url.lower().endswith(ext):
-                    return True
-            
-            return False
+            # Check if the URL has an image extension
+            return SEOURLValidator._url_extension(url) in _IMAGE_EXTS
         except Exception:
             return False
-    
+
     @staticmethod
     def is_css_url(url):
         """
         Check if a URL is a CSS URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is a CSS URL, False otherwise
         """
         try:
-            # Check if the URL ends with .css
-            return url.lower().endswith(".css")
+            # Check if the URL has a .css extension
+            return SEOURLValidator._url_extension(url) == "css"
         except Exception:
             return False
-    
+
     @staticmethod
     def is_js_url(url):
         """
         Check if a URL is a JavaScript URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is a JavaScript URL, False otherwise
         """
         try:
-            # Check if the URL ends with .js
-            return url.lower().endswith(".js")
+            # Check if the URL has a .js extension
+            return SEOURLValidator._url_extension(url) == "js"
         except Exception:
             return False
-    
+
     @staticmethod
     def is_pdf_url(url):
         """
         Check if a URL is a PDF URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is a PDF URL, False otherwise
         """
         try:
-            # Check if the URL ends with .pdf
-            return url.lower().endswith(".pdf")
+            # Check if the URL has a .pdf extension
+            return SEOURLValidator._url_extension(url) == "pdf"
         except Exception:
             return False
-    
+
     @staticmethod
     def is_html_url(url):
         """
         Check if a URL is an HTML URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is an HTML URL, False otherwise
         """
         try:
-            # Check if the URL ends with .html or .htm
-            return url.lower().endswith(".html") or url.lower().endswith(".htm")
+            # Check if the URL has a .html or .htm extension
+            return SEOURLValidator._url_extension(url) in _HTML_EXTS
         except Exception:
             return False
-    
+
     @staticmethod
     def is_xml_url(url):
         """
         Check if a URL is an XML URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is an XML URL, False otherwise
         """
         try:
-            # Check if the URL ends with .xml
-            return url.lower().endswith(".xml")
+            # Check if the URL has a .xml extension
+            return SEOURLValidator._url_extension(url) == "xml"
         except Exception:
             return False
-    
+
     @staticmethod
     def is_json_url(url):
         """
         Check if a URL is a JSON URL.
-        
+
         Args:
             url (str): The URL to check
-        
+
         Returns:
             bool: True if the URL is a JSON URL, False otherwise
         """
         try:
-            # Check if the URL ends with .json
-            return url.lower().endswith(".json")
+            # Check if the URL has a .json extension
+            return SEOURLValidator._url_extension(url) == "json"
         except Exception:
             return False
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test script for combined report generation.
+"""
+
+import os
+
+# Import the necessary modules
+from seo_report import ReportGenerator
+from test_seo_report import (
+    MockMetaDescriptionAnalyzer,
+    MockImageAnalyzer,
+    MockLinksAnalyzer,
+    MockReachabilityAnalyzer,
+    MockMainTopicAnalyzer
+)
+from test_final_report import MockSearchConsoleAnalyzer, MockSEMrushAnalyzer
+from test_comparison_report import MockSearchConsoleComparison
+
+def test_combined_report_generation():
+    print("Testing combined report generation...")
+
+    # Create mock analyzers
+    meta_analyzer = MockMetaDescriptionAnalyzer()
+    image_analyzer = MockImageAnalyzer()
+    links_analyzer = MockLinksAnalyzer()
+    reachability_analyzer = MockReachabilityAnalyzer()
+    topic_analyzer = MockMainTopicAnalyzer()
+    search_console_analyzer = MockSearchConsoleAnalyzer()
+    semrush_analyzer = MockSEMrushAnalyzer()
+    search_console_comparison = MockSearchConsoleComparison()
+
+    # Create a report generator
+    report_generator = ReportGenerator()
+
+    # Generate the report
+    report_path = report_generator.generate_combined_report(
+        "https://example.com",
+        meta_analyzer,
+        image_analyzer,
+        links_analyzer,
+        reachability_analyzer,
+        topic_analyzer,
+        search_console_analyzer,
+        semrush_analyzer,
+        search_console_comparison
+    )
+
+    # Check if the report was generated
+    if os.path.exists(report_path):
+        print(f"Combined report generated successfully: {report_path}")
+        print("Test passed!")
+    else:
+        print(f"Error: Report file not found at {report_path}")
+        print("Test failed!")
+
+if __name__ == "__main__":
+    test_combined_report_generation()
@@ -6,13 +6,11 @@ Test script for final report generation.
 """
 
 import os
-import sys
-import pandas as pd
 import numpy as np
-from docx import Document
-from datetime import datetime
+from types import MappingProxyType
 
 # Import the necessary modules
+from cluster_stats import aggregate_clusters
 from seo_report import ReportGenerator
 from test_seo_report import (
     MockMetaDescriptionAnalyzer,
@@ -22,105 +20,123 @@ from test_seo_report import (
     MockMainTopicAnalyzer
 )
 
+# Shared immutable fixture data, built once per process; the mocks just
+# bind these, so repeated instantiation allocates nothing new
+_SC_CLUSTERS = (
+    {
+        "top_queries": ["seo", "seo tool", "seo analysis"],
+        "queries": 10,
+        "impressions": 1000,
+        "clicks": 100,
+        "avg_position": 5.5
+    },
+    {
+        "top_queries": ["web development", "web dev", "website"],
+        "queries": 5,
+        "impressions": 500,
+        "clicks": 50,
+        "avg_position": 7.2
+    },
+)
+
+_TOPICS = MappingProxyType({
+    "https://example.com": ["SEO", "Analysis", "Tool"],
+    "https://example.com/page1": ["Web Development", "Coding"]
+})
+
+_SUGGESTIONS = (
+    {
+        "source": "https://example.com",
+        "target": "https://example.com/page1",
+        "topic": "Web Development"
+    },
+    {
+        "source": "https://example.com/page1",
+        "target": "https://example.com",
+        "topic": "SEO"
+    },
+)
+
+# Column-wise copies of the cluster metrics for the numeric kernel
+_SC_IMPRESSIONS = np.asarray([c["impressions"] for c in _SC_CLUSTERS], dtype=np.float64)
+_SC_CLICKS = np.asarray([c["clicks"] for c in _SC_CLUSTERS], dtype=np.float64)
+_SC_POSITIONS = np.asarray([c["avg_position"] for c in _SC_CLUSTERS], dtype=np.float64)
+
+
 class MockSearchConsoleAnalyzer:
     def __init__(self):
-        self.clusters_data = [
-            {
-                "top_queries": ["seo", "seo tool", "seo analysis"],
-                "queries": 10,
-                "impressions": 1000,
-                "clicks": 100,
-                "avg_position": 5.5
-            },
-            {
-                "top_queries": ["web development", "web dev", "website"],
-                "queries": 5,
-                "impressions": 500,
-                "clicks": 50,
-                "avg_position": 7.2
-            }
-        ]
-        
-        self.topics_data = {
-            "https://example.com": ["SEO", "Analysis", "Tool"],
-            "https://example.com/page1": ["Web Development", "Coding"]
-        }
-        
-        self.suggestions_data = [
-            {
-                "source": "https://example.com",
-                "target": "https://example.com/page1",
-                "topic": "Web Development"
-            },
-            {
-                "source": "https://example.com/page1",
-                "target": "https://example.com",
-                "topic": "SEO"
-            }
-        ]
-    
+        self.clusters_data = _SC_CLUSTERS
+        self.topics_data = _TOPICS
+        self.suggestions_data = _SUGGESTIONS
+        self._impressions = _SC_IMPRESSIONS
+        self._clicks = _SC_CLICKS
+        self._positions = _SC_POSITIONS
+
     def get_clusters(self):
         return self.clusters_data
-    
+
     def get_topics(self):
         return self.topics_data
-    
+
+    def get_clusters_summary(self):
+        return aggregate_clusters(self._impressions, self._clicks, self._positions)
+
     def suggest_internal_links(self):
         return self.suggestions_data
 
+_SEM_CLUSTERS = (
+    {
+        "top_keywords": ["seo", "seo tool", "seo analysis"],
+        "keywords": 10,
+        "traffic": 100,
+        "avg_position": 5.5,
+        "search_volume": 1000
+    },
+    {
+        "top_keywords": ["web development", "web dev", "website"],
+        "keywords": 5,
+        "traffic": 50,
+        "avg_position": 7.2,
+        "search_volume": 500
+    },
+)
+
+_SEM_VISIBILITY = MappingProxyType({
+    "SEO": 0.8,
+    "Web Development": 0.6
+})
+
+_SEM_TRAFFIC = MappingProxyType({
+    "SEO": 100,
+    "Web Development": 50
+})
+
+# Volume/traffic stand in for impressions/clicks in the kernel
+_SEM_VOLUMES = np.asarray([c["search_volume"] for c in _SEM_CLUSTERS], dtype=np.float64)
+_SEM_TRAFFIC_COL = np.asarray([c["traffic"] for c in _SEM_CLUSTERS], dtype=np.float64)
+_SEM_POSITIONS = np.asarray([c["avg_position"] for c in _SEM_CLUSTERS], dtype=np.float64)
+
+
 class MockSEMrushAnalyzer:
     def __init__(self):
-        self.clusters_data = [
-            {
-                "top_keywords": ["seo", "seo tool", "seo analysis"],
-                "keywords": 10,
-                "traffic": 100,
-                "avg_position": 5.5,
-                "search_volume": 1000
-            },
-            {
-                "top_keywords": ["web development", "web dev", "website"],
-                "keywords": 5,
-                "traffic": 50,
-                "avg_position": 7.2,
-                "search_volume": 500
-            }
-        ]
-        
-        self.topics_data = {
-            "https://example.com": ["SEO", "Analysis", "Tool"],
-            "https://example.com/page1": ["Web Development", "Coding"]
-        }
-        
-        self.visibility_data = {
-            "SEO": 0.8,
-            "Web Development": 0.6
-        }
-        
-        self.traffic_data = {
-            "SEO": 100,
-            "Web Development": 50
-        }
-        
-        self.suggestions_data = [
-            {
-                "source": "https://example.com",
-                "target": "https://example.com/page1",
-                "topic": "Web Development"
-            },
-            {
-                "source": "https://example.com/page1",
-                "target": "https://example.com",
-                "topic": "SEO"
-            }
-        ]
-    
+        self.clusters_data = _SEM_CLUSTERS
+        self.topics_data = _TOPICS
+        self.visibility_data = _SEM_VISIBILITY
+        self.traffic_data = _SEM_TRAFFIC
+        self.suggestions_data = _SUGGESTIONS
+        self._search_volumes = _SEM_VOLUMES
+        self._traffic = _SEM_TRAFFIC_COL
+        self._positions = _SEM_POSITIONS
+
     def get_clusters(self):
         return self.clusters_data
-    
+
     def get_topics(self):
         return self.topics_data
-    
+
+    def get_clusters_summary(self):
+        return aggregate_clusters(self._search_volumes, self._traffic, self._positions)
+
     def get_visibility(self):
         return self.visibility_data
     
@@ -141,7 +157,17 @@ def test_final_report_generation():
     topic_analyzer = MockMainTopicAnalyzer()
     search_console_analyzer = MockSearchConsoleAnalyzer()
     semrush_analyzer = MockSEMrushAnalyzer()
-    
+
+    # Check the summaries against hand-computed totals; this exercises
+    # whichever cluster_stats kernel variant (numba or numpy) is active
+    expected_position = (100 * 5.5 + 50 * 7.2) / 150
+    impressions, clicks, avg_position = search_console_analyzer.get_clusters_summary()
+    assert (impressions, clicks) == (1500.0, 150.0)
+    assert abs(avg_position - expected_position) < 1e-9
+    volume, traffic, sem_position = semrush_analyzer.get_clusters_summary()
+    assert (volume, traffic) == (1500.0, 150.0)
+    assert abs(sem_position - expected_position) < 1e-9
+
     # Create a report generator
     report_generator = ReportGenerator()
     
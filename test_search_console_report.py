@@ -6,11 +6,6 @@ Test script for Search Console report generation.
 """
 
 import os
-import sys
-import pandas as pd
-import numpy as np
-from docx import Document
-from datetime import datetime
 
 # Import the necessary modules
 from seo_report import ReportGenerator
@@ -20,6 +20,9 @@ from seo_links import LinksAnalyzer
 from seo_reachability import ReachabilityAnalyzer
 from seo_main_topic import MainTopicAnalyzer
 
+# Each mock builds its DataFrame once, up front; Arrow-backed columns keep
+# the strings in contiguous buffers instead of per-cell Python objects
+
 class MockMetaDescriptionAnalyzer:
     def __init__(self):
         self.data = {
@@ -29,9 +32,10 @@ class MockMetaDescriptionAnalyzer:
             "Meta Description Length": [25, 0],
             "Meta Description Quality": ["good", "too_short"]
         }
-    
+        self._df = pd.DataFrame(self.data).convert_dtypes(dtype_backend="pyarrow")
+
     def to_dataframe(self):
-        return pd.DataFrame(self.data)
+        return self._df
 
 class MockImageAnalyzer:
     def __init__(self):
@@ -42,9 +46,10 @@ class MockImageAnalyzer:
             "Alt Text": ["Alt text for image 1", ""],
             "Image Size": [50000, 150000]
         }
-    
+        self._df = pd.DataFrame(self.data).convert_dtypes(dtype_backend="pyarrow")
+
     def to_dataframe(self):
-        return pd.DataFrame(self.data)
+        return self._df
 
 class MockLinksAnalyzer:
     def __init__(self):
@@ -57,9 +62,10 @@ class MockLinksAnalyzer:
             "Is Broken": [False, False],
             "Is Nofollow": [False, True]
         }
-    
+        self._df = pd.DataFrame(self.data).convert_dtypes(dtype_backend="pyarrow")
+
     def to_dataframe(self):
-        return pd.DataFrame(self.data)
+        return self._df
 
 class MockReachabilityAnalyzer:
     def __init__(self):
@@ -69,9 +75,10 @@ class MockReachabilityAnalyzer:
             "Is Orphan Page": [False, False, True],
             "Clicks from Home": [0, 1, -1]
         }
-    
+        self._df = pd.DataFrame(self.data).convert_dtypes(dtype_backend="pyarrow")
+
     def to_dataframe(self):
-        return pd.DataFrame(self.data)
+        return self._df
 
 class MockMainTopicAnalyzer:
     def __init__(self):
@@ -80,9 +87,10 @@ class MockMainTopicAnalyzer:
             "Main Topics": ["SEO, Analysis", "Web Development"],
             "Keywords": ["SEO, tool, analysis", "web, development, coding"]
         }
-    
+        self._df = pd.DataFrame(self.data).convert_dtypes(dtype_backend="pyarrow")
+
     def to_dataframe(self):
-        return pd.DataFrame(self.data)
+        return self._df
 
 def test_seo_report_generation():
     print("Testing SEO report generation...")
@@ -6,6 +6,7 @@ URL Validator Application GUI.
 Contains the main application class for the URL validator.
 """
 
+import threading
 import tkinter as tk
 from tkinter import messagebox
 from url_validator import URLValidator
@@ -102,16 +103,33 @@ class URLValidatorApp:
         self.status_label.pack(pady=10)
     
     def validate_url(self):
-        """Validate the URL and show the result."""
+        """Start validating the URL on a background thread."""
         url = self.url_entry.get().strip()
-        
-        # Reset status
-        self.status_label.config(text="")
-        
-        # Validate URL
-        is_valid, message, _ = URLValidator.validate(url)
-        
-        # Show result
+
+        # Reset status and block re-submission while the check runs
+        self.status_label.config(text="Validating...")
+        self.submit_button.config(state=tk.DISABLED)
+
+        # Run the network check off the Tk main thread so the UI doesn't
+        # freeze for the request timeout
+        threading.Thread(target=self._do_validate, args=(url,), daemon=True).start()
+
+    def _do_validate(self, url):
+        """Validate the URL and hand the result back to the UI thread."""
+        try:
+            is_valid, message, _ = URLValidator.validate(url)
+        except Exception as e:
+            # An escaping exception would kill the worker silently and
+            # leave the button disabled; surface it as a failed check
+            is_valid, message = False, f"Could not validate URL: {url}\nError: {str(e)}"
+
+        # Tk widgets are not thread-safe; marshal back via after()
+        self.root.after(0, self._apply_result, is_valid, message)
+
+    def _apply_result(self, is_valid, message):
+        """Show the validation result and re-enable the submit button."""
+        self.submit_button.config(state=tk.NORMAL)
+
         if is_valid:
             self.show_success(message)
             messagebox.showinfo(SUCCESS_TITLE, message)